@@ -2,6 +2,7 @@
 
 import logging
 import ast
+import json
 from nqrduck.module.module_controller import ModuleController
 
 logger = logging.getLogger(__name__)
@@ -23,26 +24,30 @@ class BaseSpectrometerController(ModuleController):
         # We get the different settings objects from the model
         settings = self.module.model.settings
 
-        json = {}
-        json["name"] = self.module.model.name
+        settings_json = {}
+        settings_json["name"] = self.module.model.name
 
         for category in settings.keys():
             for setting in settings[category]:
-                json[setting.name] = setting.value
+                settings_json[setting.name] = setting.value
 
-        with open(path, "w") as f:
-            f.write(str(json))
+        with open(path, "wb") as f:
+            f.write(json.dumps(settings_json, indent=2).encode())
 
     def load_settings(self, path: str) -> None:
         """Loads the settings of the spectrometer."""
-        with open(path) as f:
-            json = f.read()
+        # json.loads detects the encoding itself, so the file is read as bytes
+        with open(path, "rb") as f:
+            data = f.read()
 
-        # string to dict
-        json = ast.literal_eval(json)
+        try:
+            settings_json = json.loads(data)
+        except json.JSONDecodeError:
+            # Settings files written by older versions are python dict literals
+            settings_json = ast.literal_eval(data.decode())
 
         module_name = self.module.model.name
-        json_name = json["name"]
+        json_name = settings_json["name"]
 
         # For some reason the notification is shown twice
         if module_name != json_name:
@@ -53,8 +58,8 @@ class BaseSpectrometerController(ModuleController):
         settings = self.module.model.settings
         for category in settings.keys():
             for setting in settings[category]:
-                if setting.name in json:
-                    setting.value = json[setting.name]
+                if setting.name in settings_json:
+                    setting.value = settings_json[setting.name]
                 else:
                     message = f"Setting {setting.name} not found in settings file. A change in settings might have broken compatibility."
                     self.module.nqrduck_signal.emit("notification", ["Error", message])
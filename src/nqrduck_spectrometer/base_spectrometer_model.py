@@ -1,6 +1,7 @@
 """The base class for all spectrometer models."""
 
 import logging
+import sys
 from collections import OrderedDict
 from PyQt6.QtCore import QSettings
 from PyQt6.QtGui import QPixmap
@@ -38,7 +39,7 @@ class BaseSpectrometerModel(ModuleModel):
 
         Attributes:
             name (str) : The name of the pulse parameter
-            options (OrderedDict) : The options of the pulse parameter
+            options (tuple) : The options of the pulse parameter
         """
 
         def __init__(self, name: str):
@@ -48,7 +49,7 @@ class BaseSpectrometerModel(ModuleModel):
                 name (str) : The name of the pulse parameter
             """
             self.name = name
-            self.options = list()
+            self.set_options(())
 
         def get_pixmap(self) -> QPixmap:
             """Gets the pixmap of the pulse parameter.
@@ -66,15 +67,36 @@ class BaseSpectrometerModel(ModuleModel):
             Args:
                 option (Option) : The option to add
             """
-            self.options.append(option)
+            self._options += (option,)
+            # Like a search through the options, the first option with a name is found
+            self._options_by_name.setdefault(option.name, option)
 
-        def get_options(self) -> list:
+        @property
+        def options(self) -> tuple:
+            """The options of the pulse parameter.
+
+            The options are read-only, use add_option and set_options to change them.
+            """
+            return self._options
+
+        def set_options(self, options: list) -> None:
+            """Replaces all options of the pulse parameter.
+
+            Args:
+                options (list) : The new options of the pulse parameter
+            """
+            self._options = tuple(options)
+            self._options_by_name = {}
+            for option in self._options:
+                self._options_by_name.setdefault(option.name, option)
+
+        def get_options(self) -> tuple:
             """Gets the options of the pulse parameter.
 
             Returns:
-                list : The options of the pulse parameter
+                tuple : The options of the pulse parameter
             """
-            return self.options
+            return self._options
 
         def get_option_by_name(self, name: str) -> "Option":
             """Gets an option by its name.
@@ -88,10 +110,10 @@ class BaseSpectrometerModel(ModuleModel):
             Raises:
                 ValueError : If no option with the specified name is found
             """
-            for option in self.options:
-                if option.name == name:
-                    return option
-            raise ValueError(f"Option with name {name} not found")
+            try:
+                return self._options_by_name[name]
+            except KeyError:
+                raise ValueError(f"Option with name {name} not found")
 
     def __init__(self, module):
         """Initializes the spectrometer model.
@@ -101,26 +123,59 @@ class BaseSpectrometerModel(ModuleModel):
         """
         super().__init__(module)
         self.settings = OrderedDict()
+        self._settings_by_name = dict()
         self.pulse_parameter_options = OrderedDict()
         self.default_settings = QSettings("nqrduck-spectrometer", "nqrduck")
+        # Only the user scope is used, so don't look up system wide fallbacks
+        self.default_settings.setFallbacksEnabled(False)
 
     def set_default_settings(self) -> None:
         """Sets the default settings of the spectrometer."""
         self.default_settings.clear()
-        for category in self.settings.keys():
-            for setting in self.settings[category]:
-                setting_string = f"{self.module.model.name},{setting.name}"
-                self.default_settings.setValue(setting_string, setting.value)
-                logger.debug(f"Setting default value for {setting_string} to {setting.value}")
+        # All settings of a spectrometer are stored in a group named after the spectrometer
+        self.default_settings.beginGroup(self.module.model.name)
+        for name, setting in self._settings_by_name.items():
+            self.default_settings.setValue(name, setting.value)
+            logger.debug("Setting default value for %s to %s", name, setting.value)
+        self.default_settings.endGroup()
+        # Write everything to the backend at once
+        self.default_settings.sync()
 
     def load_default_settings(self) -> None:
-        """Load the default settings of the spectrometer."""
-        for category in self.settings.keys():
-            for setting in self.settings[category]:
-                setting_string = f"{self.module.model.name},{setting.name}"
-                if self.default_settings.contains(setting_string):
-                    logger.debug(f"Loading default value for {setting_string}")
-                    setting.value = self.default_settings.value(setting_string)
+        """Load the default settings of the spectrometer.
+
+        Defaults stored by older versions under flat '<spectrometer>,<setting>' keys are moved into the group of the spectrometer.
+        """
+        module_name = self.module.model.name
+        values = dict()
+        missing = []
+        self.default_settings.beginGroup(module_name)
+        for name in self._settings_by_name:
+            if self.default_settings.contains(name):
+                values[name] = self.default_settings.value(name)
+            else:
+                missing.append(name)
+        self.default_settings.endGroup()
+
+        migrated = dict()
+        for name in missing:
+            legacy_key = f"{module_name},{name}"
+            if self.default_settings.contains(legacy_key):
+                logger.debug("Migrating legacy default value %s", legacy_key)
+                migrated[name] = self.default_settings.value(legacy_key)
+                self.default_settings.remove(legacy_key)
+
+        if migrated:
+            self.default_settings.beginGroup(module_name)
+            for name, value in migrated.items():
+                self.default_settings.setValue(name, value)
+            self.default_settings.endGroup()
+            self.default_settings.sync()
+            values.update(migrated)
+
+        for name, value in values.items():
+            logger.debug("Loading default value for %s", name)
+            self._settings_by_name[name].value = value
 
     def clear_default_settings(self) -> None:
         """Clear the default settings of the spectrometer."""
@@ -136,6 +191,7 @@ class BaseSpectrometerModel(ModuleModel):
         if category not in self.settings.keys():
             self.settings[category] = []
         self.settings[category].append(setting)
+        self._settings_by_name[setting.name] = setting
 
     def get_setting_by_name(self, name: str) -> Setting:
         """Gets a setting by its name.
@@ -149,11 +205,10 @@ class BaseSpectrometerModel(ModuleModel):
         Raises:
             ValueError : If no setting with the specified name is found
         """
-        for category in self.settings.keys():
-            for setting in self.settings[category]:
-                if setting.name == name:
-                    return setting
-        raise ValueError(f"Setting with name {name} not found")
+        try:
+            return self._settings_by_name[name]
+        except KeyError:
+            raise ValueError(f"Setting with name {name} not found")
 
     def add_pulse_parameter_option(
         self, name: str, pulse_parameter_class: PulseParameter
@@ -164,7 +219,8 @@ class BaseSpectrometerModel(ModuleModel):
             name (str) : The name of the pulse parameter
             pulse_parameter_class (PulseParameter) : The pulse parameter class
         """
-        self.pulse_parameter_options[name] = pulse_parameter_class
+        # Names are interned so lookups with the names of loaded sequences compare by identity
+        self.pulse_parameter_options[sys.intern(name)] = pulse_parameter_class
 
     @property
     def target_frequency(self):
@@ -5,8 +5,8 @@ from PyQt6.QtWidgets import (
     QWidget,
     QLabel,
     QHBoxLayout,
+    QFormLayout,
     QSizePolicy,
-    QSpacerItem,
     QVBoxLayout,
     QPushButton,
     QDialog,
@@ -37,88 +37,93 @@ class BaseSpectrometerView(ModuleView):
         self.widget = widget
         self._ui_form.setupUi(self)
 
-        grid = self._ui_form.gridLayout
-        self._ui_form.verticalLayout.removeItem(self._ui_form.gridLayout)
-        # Add name of the spectrometer to the view
-        label = QLabel(f"{self.module.model.toolbar_name} Settings:")
-        label.setStyleSheet("font-weight: bold;")
-        self._ui_form.verticalLayout.setSpacing(5)
-        self._ui_form.verticalLayout.addWidget(label)
-        self._ui_form.verticalLayout.addLayout(grid)
-
-        for category_count, category in enumerate(self.module.model.settings.keys()):
-            logger.debug("Adding settings for category: %s", category)
-            category_layout = QVBoxLayout()
-            category_label = QLabel(f"{category}:")
-            category_label.setStyleSheet("font-weight: bold;")
-            row = category_count // 2
-            column = category_count % 2
-
-            category_layout.addWidget(category_label)
-            for setting in self.module.model.settings[category]:
-                logger.debug("Adding setting to settings view: %s", setting.name)
-
-                spacer = QSpacerItem(20, 20)
-                # Create a label for the setting
-                setting_label = QLabel(setting.name)
-                setting_label.setMinimumWidth(200)
-
-                edit_widget = setting.widget
-                logger.debug("Setting widget: %s", edit_widget)
-
-                # Add a icon that can be used as a tooltip
-                if setting.description is not None:
-                    logger.debug("Adding tooltip to setting: %s", setting.name)
-                    icon = Logos.QuestionMark_16x16()
-                    icon_label = QLabel()
-                    icon_label.setPixmap(icon.pixmap(icon.availableSizes()[0]))
-                    icon_label.setFixedSize(icon.availableSizes()[0])
-
-                    icon_label.setToolTip(setting.description)
-
-                # Add a horizontal layout for the setting
-                layout = QHBoxLayout()
-                # Add the label and the line edit to the layout
-                layout.addItem(spacer)
-                layout.addWidget(setting_label)
-                layout.addWidget(edit_widget)
-                layout.addStretch(1)
-                layout.addWidget(icon_label)
-
-                # Add the layout to the vertical layout of the widget
-                category_layout.addLayout(layout)
-
-            category_layout.addStretch(1)
-            self._ui_form.gridLayout.addLayout(category_layout, row, column)
-
-        # Push all the settings to the top of the widget
-        self._ui_form.verticalLayout.addStretch(1)
-
-        # Now we add a save and load button to the widget
-        self.button_layout = QHBoxLayout()
-
-        # Default Settings Button
-        self.default_button = QPushButton("Default Settings")
-        self.default_button.clicked.connect(self.on_default_button_clicked)
-        self.button_layout.addWidget(self.default_button)
-
-        # Save Button
-        self.save_button = QPushButton("Save Settings")
-        self.save_button.setIcon(Logos.Save16x16())
-        self.save_button.setIconSize(Logos.Save16x16().availableSizes()[0])
-        self.save_button.clicked.connect(self.on_save_button_clicked)
-        self.button_layout.addWidget(self.save_button)
-
-        # Load Button
-        self.load_button = QPushButton("Load Settings")
-        self.load_button.setIcon(Logos.Load16x16())
-        self.load_button.clicked.connect(self.on_load_button_clicked)
-        self.button_layout.addWidget(self.load_button)
-        self.load_button.setIconSize(Logos.Load16x16().availableSizes()[0])
-
-        self.button_layout.addStretch(1)
-
-        self._ui_form.verticalLayout.addLayout(self.button_layout)
+        # Don't repaint while the settings widgets are added one by one
+        self.setUpdatesEnabled(False)
+        try:
+            grid = self._ui_form.gridLayout
+            self._ui_form.verticalLayout.removeItem(self._ui_form.gridLayout)
+            # Add name of the spectrometer to the view
+            label = QLabel(f"{self.module.model.toolbar_name} Settings:")
+            label.setStyleSheet("font-weight: bold;")
+            self._ui_form.verticalLayout.setSpacing(5)
+            self._ui_form.verticalLayout.addWidget(label)
+            self._ui_form.verticalLayout.addLayout(grid)
+
+            for category_count, category in enumerate(self.module.model.settings.keys()):
+                logger.debug("Adding settings for category: %s", category)
+                category_layout = QVBoxLayout()
+                category_label = QLabel(f"{category}:")
+                category_label.setStyleSheet("font-weight: bold;")
+                row = category_count // 2
+                column = category_count % 2
+
+                category_layout.addWidget(category_label)
+
+                # The form layout aligns the labels and the edit widgets of all settings in the category
+                form_layout = QFormLayout()
+                form_layout.setContentsMargins(20, 0, 0, 0)
+                for setting in self.module.model.settings[category]:
+                    logger.debug("Adding setting to settings view: %s", setting.name)
+
+                    # Create a label for the setting
+                    setting_label = QLabel(setting.name)
+                    setting_label.setMinimumWidth(200)
+
+                    edit_widget = setting.widget
+                    logger.debug("Setting widget: %s", edit_widget)
+
+                    # Add a horizontal layout for the edit widget and the tooltip icon
+                    layout = QHBoxLayout()
+                    layout.addWidget(edit_widget)
+                    layout.addStretch(1)
+
+                    # Add a icon that can be used as a tooltip
+                    if setting.description is not None:
+                        logger.debug("Adding tooltip to setting: %s", setting.name)
+                        icon = Logos.QuestionMark_16x16()
+                        icon_label = QLabel()
+                        icon_label.setPixmap(icon.pixmap(icon.availableSizes()[0]))
+                        icon_label.setFixedSize(icon.availableSizes()[0])
+
+                        icon_label.setToolTip(setting.description)
+                        layout.addWidget(icon_label)
+
+                    form_layout.addRow(setting_label, layout)
+
+                category_layout.addLayout(form_layout)
+                category_layout.addStretch(1)
+                self._ui_form.gridLayout.addLayout(category_layout, row, column)
+
+            # Push all the settings to the top of the widget
+            self._ui_form.verticalLayout.addStretch(1)
+
+            # Now we add a save and load button to the widget
+            self.button_layout = QHBoxLayout()
+
+            # Default Settings Button
+            self.default_button = QPushButton("Default Settings")
+            self.default_button.clicked.connect(self.on_default_button_clicked)
+            self.button_layout.addWidget(self.default_button)
+
+            # Save Button
+            self.save_button = QPushButton("Save Settings")
+            self.save_button.setIcon(Logos.Save16x16())
+            self.save_button.setIconSize(Logos.Save16x16().availableSizes()[0])
+            self.save_button.clicked.connect(self.on_save_button_clicked)
+            self.button_layout.addWidget(self.save_button)
+
+            # Load Button
+            self.load_button = QPushButton("Load Settings")
+            self.load_button.setIcon(Logos.Load16x16())
+            self.load_button.clicked.connect(self.on_load_button_clicked)
+            self.button_layout.addWidget(self.load_button)
+            self.load_button.setIconSize(Logos.Load16x16().availableSizes()[0])
+
+            self.button_layout.addStretch(1)
+
+            self._ui_form.verticalLayout.addLayout(self.button_layout)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def on_save_button_clicked(self):
         """This method is called when the save button is clicked."""
@@ -4,7 +4,9 @@ Careful - this is not the base class for the spectrometer submodules, but the co
 """
 
 import logging
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+import sys
+from functools import lru_cache
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QThread
 from nqrduck.module.module_controller import ModuleController
 from nqrduck.core.main_controller import MainController
 from nqrduck_spectrometer.base_spectrometer import BaseSpectrometer
@@ -12,6 +14,21 @@ from nqrduck_spectrometer.base_spectrometer import BaseSpectrometer
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_modules(path_key: tuple) -> dict:
+    """Returns the modules with entry points in the nqrduck group.
+
+    The entry point discovery reads the metadata of every installed distribution, so the result is cached.
+
+    Args:
+        path_key (tuple): The current sys.path. The modules are discovered again if it changes.
+
+    Returns:
+        dict: The modules with their names as keys.
+    """
+    return MainController._get_modules()
+
+
 class SpectrometerController(ModuleController):
     """This class is the controller for the spectrometer module."""
 
@@ -20,33 +37,54 @@ class SpectrometerController(ModuleController):
         super().__init__(module)
         self.measurement_thread = None
         self.measurement_worker = None
+        # Controller of the active spectrometer, updated when the active spectrometer changes
+        self._active_controller = None
+
+        # Handlers for the signals of the nqrduck module
+        self._signal_handlers = {
+            # This signal starts a measurement
+            "start_measurement": self._on_start_measurement_signal,
+            # This signal sets the frequency
+            "set_frequency": self._on_set_frequency_signal,
+            # This signal sets the number of averages
+            "set_averages": self._on_set_averages_signal,
+        }
 
     def _load_spectrometer_modules(self) -> None:
         """This method loads the spectrometer (sub-)modules and adds them to the spectrometer model."""
         # Get the modules with entry points in the nqrduck group
-        modules = MainController._get_modules()
+        modules = _get_modules(tuple(sys.path))
         logger.debug("Found modules: %s", modules)
 
-        for module_name, module in modules.items():
-            # Check if the module instance is a spectrometer by checking if it inherits from BaseSpectrometer
-            if not issubclass(type(module), BaseSpectrometer):
-                logger.debug(
-                    "Module is not a spectrometer: %s ... skipping", module_name
-                )
-                continue
-
-            # Import the module
-            logger.debug("Loading spectrometer module: %s", module_name)
-            module.model.widget_changed.connect(
-                self._module.view.on_spectrometer_widget_changed
-            )
-            logger.debug("Adding spectrometer to spectrometer model: %s", module_name)
-            self._module.model.add_spectrometers(module_name, module)
-
-            module.controller.on_loading()
+        # Only modules that inherit from BaseSpectrometer are spectrometers
+        spectrometers = {
+            module_name: module
+            for module_name, module in modules.items()
+            if isinstance(module, BaseSpectrometer)
+        }
+        logger.debug("Found spectrometer modules: %s", list(spectrometers))
+
+        on_spectrometer_widget_changed = self._module.view.on_spectrometer_widget_changed
+        # The view is repainted once after all spectrometer widgets have been added
+        self._module.view.setUpdatesEnabled(False)
+        try:
+            for module_name, module in spectrometers.items():
+                logger.debug("Loading spectrometer module: %s", module_name)
+                module.model.widget_changed.connect(on_spectrometer_widget_changed)
+                # on_loading runs while its spectrometer is the active one
+                self._module.model.add_spectrometers(module_name, module)
+                module.controller.on_loading()
+        finally:
+            self._module.view.setUpdatesEnabled(True)
 
         self._module.view.create_menu_entry()
 
+    @classmethod
+    def invalidate_entry_point_cache(cls) -> None:
+        """Clears the cached modules so they are discovered again on the next load."""
+        _get_modules.cache_clear()
+
+    @pyqtSlot(str, object)
     def process_signals(self, key: str, value: object) -> None:
         """This method processes the signals from the nqrduck module.
 
@@ -57,15 +95,21 @@ class SpectrometerController(ModuleController):
             key (str): Name of the signal.
             value (object): Value of the signal.
         """
-        # This signal starts a measurement
-        if key == "start_measurement":
-            self.start_measurement_in_thread()
-        # This signal sets the frequency
-        elif key == "set_frequency":
-            self.module.model.active_spectrometer.controller.set_frequency(value)
-        # This signal sets the number of averages
-        elif key == "set_averages":
-            self.module.model.active_spectrometer.controller.set_averages(value)
+        handler = self._signal_handlers.get(key)
+        if handler is not None:
+            handler(value)
+
+    def _on_start_measurement_signal(self, value: object) -> None:
+        """Starts a measurement in a separate thread."""
+        self.start_measurement_in_thread()
+
+    def _on_set_frequency_signal(self, value: object) -> None:
+        """Sets the frequency of the active spectrometer."""
+        self._active_controller.set_frequency(value)
+
+    def _on_set_averages_signal(self, value: object) -> None:
+        """Sets the number of averages of the active spectrometer."""
+        self._active_controller.set_averages(value)
 
     def on_loading(self) -> None:
         """This method is called when the module is loaded.
@@ -78,8 +122,22 @@ class SpectrometerController(ModuleController):
         self._module.model.active_spectrometer_changed.connect(
             self.module.view.on_active_spectrometer_changed
         )
+        self._module.model.active_spectrometer_changed.connect(
+            self.on_active_spectrometer_changed
+        )
         self._load_spectrometer_modules()
 
+    @pyqtSlot(BaseSpectrometer)
+    def on_active_spectrometer_changed(self, module: BaseSpectrometer) -> None:
+        """This method is called when the active spectrometer is changed.
+
+        It stores the controller of the spectrometer that the nqrduck signals are forwarded to.
+
+        Args:
+            module (BaseSpectrometer) : The spectrometer module that was just activated
+        """
+        self._active_controller = module.controller
+
     def on_measurement_start(self) -> None:
         """This method is called when a measurement is started.
 
@@ -89,10 +147,19 @@ class SpectrometerController(ModuleController):
             "Measurement started with spectrometer: %s",
             self.module.model.active_spectrometer,
         )
-        self.module.model.active_spectrometer.controller.start_measurement()
+        self._active_controller.start_measurement()
 
     def start_measurement_in_thread(self):
         """This method starts the measurement in a separate QThread."""
+        # Replacing the running thread would destroy it while the measurement is still running
+        if self.measurement_thread is not None:
+            logger.warning("A measurement is already running, not starting another one")
+            self.module.nqrduck_signal.emit(
+                "notification",
+                ["Error", "A measurement is already running, not starting another one"],
+            )
+            return
+
         self.measurement_thread = QThread()
         self.measurement_worker = MeasurementWorker(self)
         self.measurement_worker.moveToThread(self.measurement_thread)
@@ -100,8 +167,17 @@ class SpectrometerController(ModuleController):
         self.measurement_worker.finished.connect(self.measurement_thread.quit)
         self.measurement_worker.finished.connect(self.measurement_worker.deleteLater)
         self.measurement_thread.finished.connect(self.measurement_thread.deleteLater)
+        self.measurement_thread.finished.connect(self.on_measurement_thread_finished)
         self.measurement_thread.start()
 
+    def on_measurement_thread_finished(self) -> None:
+        """This method is called when the measurement thread has finished.
+
+        It releases the references to the thread and the worker, which are deleted by Qt.
+        """
+        self.measurement_thread = None
+        self.measurement_worker = None
+
 
 class MeasurementWorker(QObject):
     """Worker class to run the measurement in a separate thread."""
@@ -114,6 +190,16 @@ class MeasurementWorker(QObject):
         self.controller = controller
 
     def run(self):
-        """Run the measurement."""
-        self.controller.on_measurement_start()
-        self.finished.emit()
+        """Run the measurement.
+
+        finished is always emitted, so a failing measurement does not block later measurements.
+        """
+        try:
+            self.controller.on_measurement_start()
+        except Exception as e:
+            logger.exception("Measurement failed")
+            self.controller.module.nqrduck_signal.emit(
+                "notification", ["Error", f"Measurement failed: {e}"]
+            )
+        finally:
+            self.finished.emit()
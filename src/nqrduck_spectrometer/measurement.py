@@ -1,6 +1,8 @@
 """This module defines the measurement data structure and the fit class for measurement data."""
 
 import logging
+import base64
+from collections import OrderedDict
 import numpy as np
 from scipy.optimize import curve_fit
 from nqrduck.helpers.signalprocessing import SignalProcessing as sp
@@ -8,6 +10,10 @@ from nqrduck.helpers.functions import Function
 
 logger = logging.getLogger(__name__)
 
+# Apodization weights are cached for the most recently used functions
+APODIZATION_CACHE_SIZE = 32
+_apodization_weights = OrderedDict()
+
 
 class Measurement:
     """This class defines how measurement data should look.
@@ -49,23 +55,28 @@ class Measurement:
         self.target_frequency = target_frequency
         self.frequency_shift = frequency_shift
         self.IF_frequency = IF_frequency
-        self.fdx, self.fdy = sp.fft(tdx, tdy, frequency_shift)
         self.fits = []
 
-    def apodization(self, function: Function) -> "Measurement":
+    def apodization(self, function: Function, out: np.array = None):
         """Applies apodization to the measurement data.
 
         Args:
             function (Function): Apodization function.
+            out (np.array, optional): Buffer with the shape of tdy the apodized data is written to.
+                If it is given, only the buffer is returned, so it can be reused for repeated previews.
 
         Returns:
-            Measurement: The apodized measurement.
+            Measurement | np.array: The apodized measurement, or out if a buffer was given.
         """
         duration = (self.tdx[-1] - self.tdx[0]) * 1e-6
         resolution = duration / len(self.tdx)
         logger.debug("Resolution: %s", resolution)
 
-        y_weight = function.get_pulse_amplitude(duration, resolution)
+        y_weight = get_apodization_weights(function, duration, resolution)
+
+        if out is not None:
+            return np.multiply(self.tdy, y_weight, out=out)
+
         tdy_apodized = self.tdy * y_weight
 
         apodized_measurement = Measurement(
@@ -83,7 +94,8 @@ class Measurement:
         Args:
             fit (Fit): The fit to add.
         """
-        self.fits.append(fit)
+        self._fits[id(fit)] = fit
+        self._fits_list = None
 
     def delete_fit(self, fit: "Fit") -> None:
         """Deletes a fit from the measurement.
@@ -91,7 +103,11 @@ class Measurement:
         Args:
             fit (Fit): The fit to delete.
         """
-        self.fits.remove(fit)
+        try:
+            del self._fits[id(fit)]
+        except KeyError:
+            raise ValueError(f"Fit {fit.name} not found.")
+        self._fits_list = None
 
     def edit_fit_name(self, fit: "Fit", name: str) -> None:
         """Edits the name of a fit.
@@ -100,7 +116,7 @@ class Measurement:
             fit (Fit): The fit to edit.
             name (str): The new name.
         """
-        logger.debug(f"Editing fit name to {name}.")
+        logger.debug("Editing fit name to %s.", name)
         fit.name = name
 
     def to_json(self) -> dict:
@@ -111,11 +127,11 @@ class Measurement:
         """
         return {
             "name": self.name,
-            "tdx": self.tdx.tolist(),
-            "tdy": [[x.real, x.imag] for x in self.tdy],
+            "tdx": array_to_json(self.tdx, "<f8"),
+            "tdy": array_to_json(self.tdy, "<c16"),
             "target_frequency": self.target_frequency,
             "IF_frequency": self.IF_frequency,
-            "fits": [fit.to_json() for fit in self.fits],
+            "fits": [fit.to_json() for fit in self._fits.values()],
         }
 
     @classmethod
@@ -128,10 +144,23 @@ class Measurement:
         Returns:
             Measurement: The measurement.
         """
-        tdy = np.array([complex(y[0], y[1]) for y in json["tdy"]])
+        if isinstance(json["tdy"], dict):
+            tdx = array_from_json(json["tdx"])
+            tdy = array_from_json(json["tdy"])
+        else:
+            # Measurements saved by older versions store the data as lists
+            tdx = np.array(json["tdx"])
+            # The [real, imag] pairs have the same memory layout as a complex array
+            tdy = (
+                np.asarray(json["tdy"], dtype=np.float64)
+                .reshape(-1, 2)
+                .view(np.complex128)
+                .reshape(-1)
+            )
+
         measurement = cls(
             json["name"],
-            np.array(json["tdx"]),
+            tdx,
             tdy,
             target_frequency=json["target_frequency"],
             IF_frequency=json["IF_frequency"],
@@ -144,13 +173,21 @@ class Measurement:
 
     # Properties for encapsulation
     @property
-    def name(self) -> str:
-        """Name of the measurement."""
-        return self._name
+    def fits(self) -> list:
+        """Fits of the measurement.
 
-    @name.setter
-    def name(self, value: str) -> None:
-        self._name = value
+        Use add_fit and delete_fit to change the fits, changes to the returned list are not stored.
+        """
+        # The list is only built again after the fits have changed
+        if self._fits_list is None:
+            self._fits_list = list(self._fits.values())
+        return self._fits_list
+
+    @fits.setter
+    def fits(self, value: list) -> None:
+        # Fits are stored by identity so they can be deleted without searching
+        self._fits = {id(fit): fit for fit in value}
+        self._fits_list = None
 
     @property
     def tdx(self) -> np.array:
@@ -160,6 +197,8 @@ class Measurement:
     @tdx.setter
     def tdx(self, value: np.array) -> None:
         self._tdx = value
+        # The frequency domain data is calculated again on the next access
+        self._fd_valid = False
 
     @property
     def tdy(self) -> np.array:
@@ -169,56 +208,132 @@ class Measurement:
     @tdy.setter
     def tdy(self, value: np.array) -> None:
         self._tdy = value
+        self._fd_valid = False
+
+    def _update_frequency_domain(self) -> None:
+        """Calculates the frequency domain data from the time domain data if it is not up to date."""
+        if not self._fd_valid:
+            self._fdx, self._fdy = sp.fft(self._tdx, self._tdy, self.frequency_shift)
+            self._fd_valid = True
 
     @property
     def fdx(self) -> np.array:
-        """Frequency domain data for the measurement (x)."""
+        """Frequency domain data for the measurement (x).
+
+        It is calculated from the time domain data on first access.
+        """
+        self._update_frequency_domain()
         return self._fdx
 
     @fdx.setter
     def fdx(self, value: np.array) -> None:
+        # fdy is calculated first, so the assigned value is not overwritten by the next calculation
+        self._update_frequency_domain()
         self._fdx = value
 
     @property
     def fdy(self) -> np.array:
-        """Frequency domain data for the measurement (y)."""
+        """Frequency domain data for the measurement (y).
+
+        It is calculated from the time domain data on first access.
+        """
+        self._update_frequency_domain()
         return self._fdy
 
     @fdy.setter
     def fdy(self, value: np.array) -> None:
+        self._update_frequency_domain()
         self._fdy = value
 
-    @property
-    def target_frequency(self) -> float:
-        """Target frequency of the measurement."""
-        return self._target_frequency
 
-    @target_frequency.setter
-    def target_frequency(self, value: float) -> None:
-        self._target_frequency = value
+def get_apodization_weights(
+    function: Function, duration: float, resolution: float
+) -> np.array:
+    """Returns the apodization weights of a function.
 
-    @property
-    def fits(self) -> list:
-        """Fits of the measurement."""
-        return self._fits
+    The weights are cached, so applying the same function to measurements with the same duration and resolution
+    evaluates the function only once. The function is identified by its JSON representation, so changing its
+    expression or parameters results in new weights.
 
-    @fits.setter
-    def fits(self, value: list) -> None:
-        self._fits = value
+    Args:
+        function (Function): Apodization function.
+        duration (float): Duration of the measurement in s.
+        resolution (float): Time resolution of the measurement in s.
+
+    Returns:
+        np.array: The read-only apodization weights.
+    """
+    key = (repr(function.to_json()), duration, resolution)
+    weights = _apodization_weights.get(key)
+    if weights is not None:
+        _apodization_weights.move_to_end(key)
+        return weights
+
+    weights = np.array(function.get_pulse_amplitude(duration, resolution))
+    weights.flags.writeable = False
+    if len(_apodization_weights) >= APODIZATION_CACHE_SIZE:
+        # Drop the least recently used entry
+        _apodization_weights.popitem(last=False)
+    _apodization_weights[key] = weights
+    return weights
+
+
+def array_to_json(array: np.array, dtype: str) -> dict:
+    """Converts a numpy array to a JSON-compatible format.
+
+    The raw bytes of the array are stored base64 encoded together with the dtype and the shape.
+
+    Args:
+        array (np.array): The array to convert.
+        dtype (str): The dtype the data is stored with, e.g. "<f8".
+
+    Returns:
+        dict: The array in JSON-compatible format.
+    """
+    array = np.ascontiguousarray(array, dtype=dtype)
+    return {
+        "b64": base64.b64encode(array.tobytes()).decode("ascii"),
+        "dtype": dtype,
+        "shape": list(array.shape),
+    }
+
+
+def array_from_json(json: dict) -> np.array:
+    """Converts the JSON format created by array_to_json back to a numpy array.
+
+    Args:
+        json (dict): The array in JSON-compatible format.
+
+    Returns:
+        np.array: The array.
+    """
+    data = base64.b64decode(json["b64"])
+    # frombuffer returns a read-only view of the bytes, so copy it
+    return np.frombuffer(data, dtype=json["dtype"]).reshape(json["shape"]).copy()
 
 
 class Fit:
     """The fit class for measurement data. A fit can be performed on either the frequency or time domain data.
 
     A measurement can have multiple fits.
+
+    Attributes:
+        x (np.array): The x data of the fit.
+        y (np.array): The y data of the fit.
     """
 
     subclasses = []
+    _subclasses_by_name = {}
+
+    # Subclasses can define jacobian(x, *parameters) returning the jacobian of the fit function
+    # with shape (len(x), number of parameters). Otherwise it is estimated numerically.
+    jacobian = None
 
     def __init_subclass__(cls, **kwargs) -> None:
         """Adds the subclass to the list of subclasses."""
         super().__init_subclass__(**kwargs)
         cls.subclasses.append(cls)
+        cls._subclasses_by_name[cls.__name__] = cls
 
     def __init__(self, name: str, domain: str, measurement: Measurement) -> None:
         """Initializes the fit."""
@@ -238,9 +353,13 @@ class Fit:
         else:
             raise ValueError("Domain not recognized.")
 
+        # The magnitude is fitted, computed once as a real float64 array
+        y_abs = np.abs(y).astype(np.float64, copy=False)
+
         initial_guess = self.initial_guess()
+        # jac is None, curve_fit's default, if the subclass has no analytic jacobian
         self.parameters, self.covariance = curve_fit(
-            self.fit_function, x, abs(y), p0=initial_guess
+            self.fit_function, x, y_abs, p0=initial_guess, jac=self.jacobian
         )
 
         self.x = x
@@ -288,29 +407,12 @@ class Fit:
         Returns:
             Fit: The fit.
         """
-        for subclass in cls.subclasses:
-            if subclass.__name__ == data["class"]:
-                return subclass(name=data["name"], measurement=measurement)
-
-        raise ValueError(f"Subclass {data['class']} not found.")
+        try:
+            subclass = cls._subclasses_by_name[data["class"]]
+        except KeyError:
+            raise ValueError(f"Subclass {data['class']} not found.")
 
-    @property
-    def x(self) -> np.array:
-        """The x data of the fit."""
-        return self._x
-
-    @x.setter
-    def x(self, value: np.array) -> None:
-        self._x = value
-
-    @property
-    def y(self) -> np.array:
-        """The y data of the fit."""
-        return self._y
-
-    @y.setter
-    def y(self, value: np.array) -> None:
-        self._y = value
+        return subclass(name=data["name"], measurement=measurement)
 
 
 class T2StarFit(Fit):
@@ -333,6 +435,11 @@ class T2StarFit(Fit):
         """The T2* fit function used for curve fitting."""
         return S0 * np.exp(-t / T2Star)
 
+    def jacobian(self, t: np.array, S0: float, T2Star: float) -> np.array:
+        """The analytic jacobian of the T2* fit function."""
+        decay = np.exp(-t / T2Star)
+        return np.column_stack((decay, S0 * t / T2Star**2 * decay))
+
     def initial_guess(self) -> list:
         """Initial guess for the T2* fit."""
         return [1, 1]
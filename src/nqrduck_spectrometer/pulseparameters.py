@@ -6,6 +6,7 @@ Todo:
 
 from __future__ import annotations
 import logging
+from functools import cache
 
 from numpy.core.multiarray import array as array
 
@@ -22,6 +23,21 @@ from .base_spectrometer_model import BaseSpectrometerModel
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _pulse_parameter_pixmap(name: str):
+    """Returns a pulse parameter asset.
+
+    The assets are loaded from disk once and then shared, as they are only used for display.
+
+    Args:
+        name (str): The name of the asset in PulseParamters, e.g. "TXOff".
+
+    Returns:
+        The loaded pulse parameter asset.
+    """
+    return getattr(PulseParamters, name)()
+
+
 class Option:
     """Defines options for the pulse parameters which can then be set accordingly.
 
@@ -37,11 +53,13 @@ class Option:
     """
 
     subclasses = []
+    _subclasses_by_name = {}
 
     def __init_subclass__(cls, **kwargs):
         """Adds the subclass to the list of subclasses."""
         super().__init_subclass__(**kwargs)
         cls.subclasses.append(cls)
+        cls._subclasses_by_name[cls.__name__] = cls
 
     def __init__(self, name: str, value) -> None:
         """Initializes the option."""
@@ -77,11 +95,7 @@ class Option:
         Returns:
             Option: The option.
         """
-        for subclass in cls.subclasses:
-            logger.debug(f"Keys data: {data.keys()}")
-            if subclass.__name__ == data["class"]:
-                cls = subclass
-                break
+        cls = cls._subclasses_by_name.get(data["class"], cls)
 
         # Check if from_json is implemented for the subclass
         if cls.from_json.__func__ == Option.from_json.__func__:
@@ -184,6 +198,7 @@ class FunctionOption(Option):
         """Initializes the FunctionOption."""
         super().__init__(name, functions[0])
         self.functions = functions
+        self._functions_by_name = {function.name: function for function in functions}
 
     def set_value(self, value):
         """Sets the value of the option.
@@ -202,10 +217,10 @@ class FunctionOption(Option):
         Returns:
             Function: The function with the given name.
         """
-        for function in self.functions:
-            if function.name == name:
-                return function
-        raise ValueError(f"Function with name {name} not found")
+        try:
+            return self._functions_by_name[name]
+        except KeyError:
+            raise ValueError(f"Function with name {name} not found")
 
     def to_json(self):
         """Returns a json representation of the option.
@@ -230,7 +245,7 @@ class FunctionOption(Option):
         Returns:
             FunctionOption: The FunctionOption.
         """
-        logger.debug(f"Data: {data}")
+        logger.debug("Data: %s", data)
         # These are all available functions
         functions = [Function.from_json(function) for function in data["functions"]]
         obj = cls(data["name"], functions)
@@ -255,7 +270,7 @@ class TXRectFunction(RectFunction):
 
     def get_pixmap(self):
         """Returns the pixmaps of the function."""
-        return PulseParamters.TXRect()
+        return _pulse_parameter_pixmap("TXRect")
 
 
 class TXSincFunction(SincFunction):
@@ -271,7 +286,7 @@ class TXSincFunction(SincFunction):
 
     def get_pixmap(self):
         """Returns the pixmaps of the function."""
-        return PulseParamters.TXSinc()
+        return _pulse_parameter_pixmap("TXSinc")
 
 
 class TXGaussianFunction(GaussianFunction):
@@ -287,7 +302,7 @@ class TXGaussianFunction(GaussianFunction):
 
     def get_pixmap(self):
         """Returns the pixmaps of the function."""
-        return PulseParamters.TXGauss()
+        return _pulse_parameter_pixmap("TXGauss")
 
 
 class TXCustomFunction(CustomFunction):
@@ -303,7 +318,7 @@ class TXCustomFunction(CustomFunction):
 
     def get_pixmap(self):
         """Returns the pixmaps of the function."""
-        return PulseParamters.TXCustom()
+        return _pulse_parameter_pixmap("TXCustom")
 
 
 class TXPulse(BaseSpectrometerModel.PulseParameter):
@@ -350,7 +365,7 @@ class TXPulse(BaseSpectrometerModel.PulseParameter):
         if self.get_option_by_name(self.RELATIVE_AMPLITUDE).value > 0:
             return self.get_option_by_name(self.TX_PULSE_SHAPE).get_pixmap()
         else:
-            pixmap = PulseParamters.TXOff()
+            pixmap = _pulse_parameter_pixmap("TXOff")
             return pixmap
 
 
@@ -381,9 +396,9 @@ class RXReadout(BaseSpectrometerModel.PulseParameter):
             QPixmap: The pixmap of the RX Readout PulseParameter depending on the RX Readout state.
         """
         if self.get_option_by_name(self.RX).value is False:
-            pixmap = PulseParamters.RXOff()
+            pixmap = _pulse_parameter_pixmap("RXOff")
         else:
-            pixmap = PulseParamters.RXOn()
+            pixmap = _pulse_parameter_pixmap("RXOn")
         return pixmap
 
 
@@ -414,7 +429,7 @@ class Gate(BaseSpectrometerModel.PulseParameter):
             QPixmap: The pixmap of the Gate PulseParameter depending on the Gate state.
         """
         if self.get_option_by_name(self.GATE_STATE).value is False:
-            pixmap = PulseParamters.GateOff()
+            pixmap = _pulse_parameter_pixmap("GateOff")
         else:
-            pixmap = PulseParamters.GateOn()
+            pixmap = _pulse_parameter_pixmap("GateOn")
         return pixmap
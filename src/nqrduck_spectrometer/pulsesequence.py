@@ -1,8 +1,8 @@
 """Contains the PulseSequence class that is used to store a pulse sequence and its events."""
 
 import logging
+import sys
 import importlib.metadata
-from collections import OrderedDict
 from nqrduck.helpers.unitconverter import UnitConverter
 from nqrduck_spectrometer.pulseparameters import Option
 
@@ -48,12 +48,14 @@ class PulseSequence:
         Attributes:
             name (str): The name of the event
             duration (str): The duration of the event
-            parameters (OrderedDict): The parameters of the event
+            parameters (dict): The parameters of the event
         """
 
+        __slots__ = ("name", "_duration", "parameters")
+
         def __init__(self, name: str, duration: str) -> None:
             """Initializes the event."""
-            self.parameters = OrderedDict()
+            self.parameters = dict()
             self.name = name
             self.duration = duration
 
@@ -61,9 +63,9 @@ class PulseSequence:
             """Adds a parameter to the event.
 
             Args:
-                parameter: The parameter to add
+                parameter (PulseParameter): The parameter to add, stored under its name
             """
-            self.parameters.append(parameter)
+            self.parameters[parameter.name] = parameter
 
         def on_duration_changed(self, duration: str) -> None:
             """This method is called when the duration of the event is changed.
@@ -90,21 +92,21 @@ class PulseSequence:
             """
             obj = cls(event["name"], event["duration"])
             for parameter in event["parameters"]:
-                for pulse_parameter_option in pulse_parameter_options.keys():
-                    # This checks if the pulse paramter options are the same as the ones in the pulse sequence
-                    if pulse_parameter_option == parameter["name"]:
-                        pulse_parameter_class = pulse_parameter_options[
-                            pulse_parameter_option
-                        ]
-                        obj.parameters[pulse_parameter_option] = pulse_parameter_class(
-                            parameter["name"]
-                        )
-                        # Delete the default instances of the pulse parameter options
-                        obj.parameters[pulse_parameter_option].options = []
-                        for option in parameter["value"]:
-                            obj.parameters[pulse_parameter_option].options.append(
-                                Option.from_json(option)
-                            )
+                name = sys.intern(parameter["name"])
+                # This checks if the pulse paramter options are the same as the ones in the pulse sequence
+                pulse_parameter_class = pulse_parameter_options.get(name)
+                if pulse_parameter_class is None:
+                    # Only reachable when load_event is called directly,
+                    # load_sequence rejects sequences with unknown parameters beforehand.
+                    logger.warning("Skipping unknown pulse parameter %s", name)
+                    continue
+
+                pulse_parameter = pulse_parameter_class(name)
+                # Replace the default instances of the pulse parameter options
+                pulse_parameter.set_options(
+                    [Option.from_json(option) for option in parameter["value"]]
+                )
+                obj.parameters[name] = pulse_parameter
 
             return obj
 
@@ -132,18 +134,21 @@ class PulseSequence:
             dict: The dict with the sequence data
         """
         # Get the versions of this package
-        data = {"name": self.name, "version" : self.version, "events": []}
-        for event in self.events:
-            event_data = {
+        data = {"name": self.name, "version" : self.version}
+        data["events"] = [
+            {
                 "name": event.name,
                 "duration": event.duration,
-                "parameters": [],
+                "parameters": [
+                    {
+                        "name": name,
+                        "value": [option.to_json() for option in parameter.options],
+                    }
+                    for name, parameter in event.parameters.items()
+                ],
             }
-            for parameter in event.parameters.keys():
-                event_data["parameters"].append({"name": parameter, "value": []})
-                for option in event.parameters[parameter].options:
-                    event_data["parameters"][-1]["value"].append(option.to_json())
-            data["events"].append(event_data)
+            for event in self.events
+        ]
         return data
 
     @classmethod
@@ -161,16 +166,30 @@ class PulseSequence:
             PulseSequence: The loaded pulse sequence
 
         Raises:
-            KeyError: If the pulse parameter options are not the same as the ones in the pulse sequence
+            KeyError: If the version is missing or the sequence uses pulse parameters the active spectrometer does not provide.
+                Such sequences, e.g. saved with another spectrometer, are rejected as a whole.
         """
         try:
             obj = cls(sequence["name"], version = sequence["version"])
         except KeyError:
             logger.error("Pulse sequence version not found")
             raise KeyError("Pulse sequence version not found")
-            
-        for event_data in sequence["events"]:
-            obj.events.append(cls.Event.load_event(event_data, pulse_parameter_options))
+
+        # The parameter names are checked once for the whole sequence instead of per event
+        parameter_names = {
+            parameter["name"]
+            for event_data in sequence["events"]
+            for parameter in event_data["parameters"]
+        }
+        unknown_names = parameter_names - pulse_parameter_options.keys()
+        if unknown_names:
+            logger.error("Pulse parameters %s not available for the active spectrometer", unknown_names)
+            raise KeyError(f"Pulse parameters {sorted(unknown_names)} not available for the active spectrometer")
+
+        obj.events = [
+            cls.Event.load_event(event_data, pulse_parameter_options)
+            for event_data in sequence["events"]
+        ]
 
         return obj
 
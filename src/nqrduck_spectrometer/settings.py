@@ -2,18 +2,53 @@
 
 import logging
 import ipaddress
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+import re
+from functools import lru_cache
+from PyQt6.QtCore import QObject, QSignalBlocker, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QLineEdit, QComboBox, QCheckBox
 from nqrduck.helpers.duckwidgets import DuckFloatEdit, DuckIntEdit, DuckSpinBox
 
 logger = logging.getLogger(__name__)
 
+# Marks a setting that has not been assigned a value yet
+_SENTINEL = object()
+
+# Dotted decimal IPv4 address without leading zeros, as accepted by ipaddress
+_IPV4_PATTERN = re.compile(
+    r"(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}"
+)
+
+
+@lru_cache(maxsize=128)
+def _is_valid_ip(value: str) -> bool:
+    """Checks if a value is a valid IP address.
+
+    The result is cached as the same addresses are validated over and over again.
+
+    Args:
+        value (str): The value to check.
+
+    Returns:
+        bool: True if the value is a valid IPv4 or IPv6 address.
+    """
+    # Plain IPv4 addresses are by far the most common, so they skip the ipaddress parser
+    if isinstance(value, str) and _IPV4_PATTERN.fullmatch(value):
+        return True
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
 
 class Setting(QObject):
     """A setting for the spectrometer is a value that is the same for all events in a pulse sequence.
 
     E.g. the Transmit gain or the number of points in a spectrum.
 
+    Subclasses have to set the widget at the end of their __init__, once all of their attributes are set.
+    Usually this is done by calling self.widget = self.get_widget().
+
     Args:
         name (str) : The name of the setting
         description (str) : A description of the setting
@@ -28,6 +63,9 @@ class Setting(QObject):
 
     settings_changed = pyqtSignal()
 
+    # Time in ms without further changes after which settings_changed is emitted
+    SETTINGS_CHANGED_DELAY = 20
+
     def __init__(self, name: str, description: str, default=None) -> None:
         """Create a new setting.
 
@@ -37,7 +75,14 @@ class Setting(QObject):
             default: The default value of the setting.
         """
         self.widget = None
+        # Set while the value is updated from the widget
+        self._updating_from_widget = False
         super().__init__()
+        # Debounces settings_changed for edits made through the widget
+        self._settings_changed_timer = QTimer(self)
+        self._settings_changed_timer.setSingleShot(True)
+        self._settings_changed_timer.setInterval(self.SETTINGS_CHANGED_DELAY)
+        self._settings_changed_timer.timeout.connect(self.settings_changed.emit)
         self.name = name
         self.description = description
         if default is not None:
@@ -45,9 +90,6 @@ class Setting(QObject):
             # Update the description with the default value
             self.description += f"\n (Default: {default})"
 
-        # This can be overridden by subclasses
-        self.widget = self.get_widget()
-
     @pyqtSlot(str)
     def on_value_changed(self, value):
         """This method is called when the value of the setting is changed.
@@ -56,8 +98,24 @@ class Setting(QObject):
             value (str): The new value of the setting.
         """
         logger.debug("Setting %s changed to %s", self.name, value)
-        self.value = value
-        self.settings_changed.emit()
+        self._updating_from_widget = True
+        try:
+            self.value = value
+        finally:
+            self._updating_from_widget = False
+
+    def notify_settings_changed(self) -> None:
+        """Emits settings_changed after the value of the setting has changed.
+
+        Changes made in code are emitted right away. Changes made through the widget are emitted
+        once there were no further edits for SETTINGS_CHANGED_DELAY ms, so that e.g. dragging a slider
+        results in a single emission.
+        """
+        if self._updating_from_widget:
+            # Restarting the timer postpones the emission until the edits have settled
+            self._settings_changed_timer.start()
+        else:
+            self.settings_changed.emit()
 
     def get_setting(self):
         """Return the value of the setting.
@@ -65,7 +123,11 @@ class Setting(QObject):
         Returns:
             The value of the setting.
         """
-        return float(self.value)
+        value = self.value
+        # FloatSetting already stores a float, so there is nothing to convert
+        if type(value) is float:
+            return value
+        return float(value)
 
     def get_widget(self):
         """Return a widget for the setting.
@@ -78,11 +140,15 @@ class Setting(QObject):
         """
         widget = QLineEdit(str(self.value))
         widget.setMinimumWidth(100)
-        widget.editingFinished.connect(
-            lambda x=widget, s=self: s.on_value_changed(x.text())
-        )
+        widget.editingFinished.connect(self.on_editing_finished)
         return widget
 
+    @pyqtSlot()
+    def on_editing_finished(self) -> None:
+        """This method is called when editing of the default QLineEdit is finished."""
+        self.on_value_changed(self.widget.text())
+
+
 class NumericalSetting(Setting):
     """A setting that is a numerical value.
 
@@ -161,6 +227,7 @@ class FloatSetting(NumericalSetting):
 
         self.widget.state_updated.connect(self.on_state_updated)
 
+    @pyqtSlot(bool, str)
     def on_state_updated(self, state, text):
         """Update the value of the setting.
 
@@ -169,8 +236,11 @@ class FloatSetting(NumericalSetting):
             text (str): The new value of the setting.
         """
         if state:
-            self.value = text
-            self.settings_changed.emit()
+            self._updating_from_widget = True
+            try:
+                self.value = text
+            finally:
+                self._updating_from_widget = False
 
     @property
     def value(self):
@@ -179,11 +249,15 @@ class FloatSetting(NumericalSetting):
 
     @value.setter
     def value(self, value):
-        logger.debug(f"Setting {self.name} to {value}")
-        self._value = float(value)
-        self.settings_changed.emit()
+        if type(value) is not float:
+            value = float(value)
+        if value == getattr(self, "_value", _SENTINEL):
+            return
+        logger.debug("Setting %s to %s", self.name, value)
+        self._value = value
+        self.notify_settings_changed()
 
-        if self.widget:
+        if self.widget and not self._updating_from_widget:
             if self.spin_box[0]:
                 self.widget.spin_box.setValue(self._value)
             else:
@@ -225,6 +299,7 @@ class IntSetting(NumericalSetting):
 
         self.widget.state_updated.connect(self.on_state_updated)
 
+    @pyqtSlot(bool, str)
     def on_state_updated(self, state, text):
         """Update the value of the setting.
 
@@ -233,8 +308,11 @@ class IntSetting(NumericalSetting):
             text (str): The new value of the setting.
         """
         if state:
-            self.value = text
-            self.settings_changed.emit()
+            self._updating_from_widget = True
+            try:
+                self.value = text
+            finally:
+                self._updating_from_widget = False
 
     @property
     def value(self):
@@ -243,11 +321,18 @@ class IntSetting(NumericalSetting):
 
     @value.setter
     def value(self, value):
-        logger.debug(f"Setting {self.name} to {value}")
-        value = int(float(value))
+        if type(value) is not int:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                # E.g. "1e3" or "2.0" from the text input
+                value = int(float(value))
+        if value == getattr(self, "_value", _SENTINEL):
+            return
+        logger.debug("Setting %s to %s", self.name, value)
         self._value = value
-        self.settings_changed.emit()
-        if self.widget:
+        self.notify_settings_changed()
+        if self.widget and not self._updating_from_widget:
             if self.spin_box[0]:
                 self.widget.spin_box.setValue(value)
             else:
@@ -266,8 +351,6 @@ class BooleanSetting(Setting):
     def __init__(self, name: str, default: bool, description: str) -> None:
         """Create a new boolean setting."""
         super().__init__(name, description, default)
-
-        # Overrides the default widget
         self.widget = self.get_widget()
 
     @property
@@ -278,10 +361,17 @@ class BooleanSetting(Setting):
     @value.setter
     def value(self, value):
         try:
-            self._value = bool(value)
+            if value is not True and value is not False:
+                value = bool(value)
+            if value == getattr(self, "_value", _SENTINEL):
+                return
+            self._value = value
             if self.widget:
+                # The checkbox would otherwise call back into this setter
+                blocker = QSignalBlocker(self.widget)
                 self.widget.setChecked(self._value)
-            self.settings_changed.emit()
+                blocker.unblock()
+            self.notify_settings_changed()
         except ValueError:
             raise ValueError("Value must be a bool")
 
@@ -295,11 +385,18 @@ class BooleanSetting(Setting):
         """
         widget = QCheckBox()
         widget.setChecked(self.value)
-        widget.stateChanged.connect(
-            lambda x=widget, s=self: s.on_value_changed(bool(x))
-        )
+        widget.stateChanged.connect(self.on_state_changed)
         return widget
 
+    @pyqtSlot(int)
+    def on_state_changed(self, state: int) -> None:
+        """This method is called when the check state of the QCheckBox changes.
+
+        Args:
+            state (int): The new check state of the QCheckBox.
+        """
+        self.on_value_changed(bool(state))
+
 
 class SelectionSetting(Setting):
     """A setting that is a selection from a list of options.
@@ -315,16 +412,25 @@ class SelectionSetting(Setting):
         self, name: str, options: list, default: str, description: str
     ) -> None:
         """Create a new selection setting."""
-        super().__init__(name, description, default)
         # Check if default is in options
         if default not in options:
             raise ValueError("Default value must be one of the options")
 
+        # The options are needed by the value setter, which is called with the default in Setting.__init__
         self.options = options
-
-        # Overrides the default widget
+        super().__init__(name, description, default)
         self.widget = self.get_widget()
 
+    @property
+    def options(self):
+        """The options to choose from. A set of them is kept for the membership check of the value."""
+        return self._options
+
+    @options.setter
+    def options(self, options):
+        self._options = options
+        self._options_set = frozenset(options)
+
     @property
     def value(self):
         """The value of the setting. In this case, a string."""
@@ -332,19 +438,17 @@ class SelectionSetting(Setting):
 
     @value.setter
     def value(self, value):
-        try:
-            if value in self.options:
-                self._value = value
-                if self.widget:
-                    self.widget.setCurrentText(value)
-                self.settings_changed.emit()
-            else:
-                raise ValueError("Value must be one of the options")
-        # This fixes a bug when creating the widget when the options are not yet set
-        except AttributeError:
-            self._value = value
-            self.options = [value]
-            self.settings_changed.emit()
+        if value == getattr(self, "_value", _SENTINEL):
+            return
+        if value not in self._options_set:
+            raise ValueError("Value must be one of the options")
+        self._value = value
+        if self.widget:
+            # The combo box would otherwise call back into this setter
+            blocker = QSignalBlocker(self.widget)
+            self.widget.setCurrentText(value)
+            blocker.unblock()
+        self.notify_settings_changed()
 
     def get_widget(self):
         """Return a widget for the setting.
@@ -357,9 +461,7 @@ class SelectionSetting(Setting):
         widget = QComboBox()
         widget.addItems(self.options)
         widget.setCurrentText(self.value)
-        widget.currentTextChanged.connect(
-            lambda x=widget, s=self: s.on_value_changed(x)
-        )
+        widget.currentTextChanged.connect(self.on_value_changed)
         return widget
 
 
@@ -376,6 +478,7 @@ class IPSetting(Setting):
         """Create a new IP setting."""
         super().__init__(name, description)
         self.value = default
+        self.widget = self.get_widget()
 
     @property
     def value(self):
@@ -384,12 +487,12 @@ class IPSetting(Setting):
 
     @value.setter
     def value(self, value):
-        try:
-            ipaddress.ip_address(value)
-            self._value = value
-        except ValueError:
+        if value == getattr(self, "_value", _SENTINEL):
+            return
+        if not _is_valid_ip(value):
             raise ValueError("Value must be a valid IP address")
-        self.settings_changed.emit()
+        self._value = value
+        self.notify_settings_changed()
 
 
 class StringSetting(Setting):
@@ -404,6 +507,7 @@ class StringSetting(Setting):
     def __init__(self, name: str, default: str, description: str) -> None:
         """Create a new string setting."""
         super().__init__(name, description, default)
+        self.widget = self.get_widget()
 
     @property
     def value(self):
@@ -413,7 +517,11 @@ class StringSetting(Setting):
     @value.setter
     def value(self, value):
         try:
-            self._value = str(value)
-            self.settings_changed.emit()
+            if type(value) is not str:
+                value = str(value)
+            if value == getattr(self, "_value", _SENTINEL):
+                return
+            self._value = value
+            self.notify_settings_changed()
         except ValueError:
             raise ValueError("Value must be a string")
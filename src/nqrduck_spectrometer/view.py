@@ -2,9 +2,10 @@
 
 import logging
 from PyQt6.QtWidgets import QWidget, QMenu
-from PyQt6.QtGui import QAction
-from PyQt6.QtCore import pyqtSlot
+from PyQt6.QtGui import QAction, QActionGroup
+from PyQt6.QtCore import QObject, QSignalBlocker, Qt, pyqtSlot
 from nqrduck.module.module_view import ModuleView
+from .base_spectrometer import BaseSpectrometer
 from .widget import Ui_Form
 
 logger = logging.getLogger(__name__)
@@ -28,79 +29,107 @@ class SpectrometerView(ModuleView):
         self.widget = widget
         self._ui_form.setupUi(self)
         self._actions = dict()
+        # Only one spectrometer menu action can be checked at a time
+        self._action_group = QActionGroup(self)
+        self._action_group.setExclusive(True)
 
+        # Shown for spectrometers without a pulse programmer, added to the stacked widget only once
         self.blank = QWidget()
+        self._ui_form.stackedWidgetPulseProgrammer.addWidget(self.blank)
 
+        # The selectors only match the stacked widgets themselves and not the stacked widgets inside the spectrometer views
         self._ui_form.stackedWidgetSettings.setStyleSheet(
-            "QStackedWidget { border: 2px solid #000; }"
+            "QStackedWidget#stackedWidgetSettings { border: 2px solid #000; }"
         )
 
         self._ui_form.stackedWidgetPulseProgrammer.setStyleSheet(
-            "QStackedWidget { border: 2px solid #000; }"
+            "QStackedWidget#stackedWidgetPulseProgrammer { border: 2px solid #000; }"
         )
 
+    @pyqtSlot(BaseSpectrometer)
     def on_active_spectrometer_changed(self, module):
         """This method is called when the active spectrometer is changed.
 
         It changes the active view in the stacked widget to the one that was just activated.
+        The views of the spectrometer are added to the stacked widgets when it is activated for the first time.
 
         Args:
             module (BaseSpectrometer) : The spectrometer module that was just activated
         """
-        self._ui_form.stackedWidgetSettings.setCurrentWidget(module.settings_view)
-
-        try:
-            self._ui_form.stackedWidgetPulseProgrammer.setCurrentWidget(
-                module.model.pulse_programmer.pulse_programmer_view
-            )
-        except AttributeError:
-            logger.debug(
-                "No pulse programmer widget to change to for spectrometer %s",
-                module.model.name,
-            )
-            self._ui_form.stackedWidgetPulseProgrammer.setCurrentWidget(self.blank)
+        self._show_spectrometer_views(module)
 
+    @pyqtSlot(QObject)
     def on_spectrometer_widget_changed(self, module):
         """This method is called when a new spectrometer widget is added to the module.
 
-        It adds the widget to the stacked widget and sets it as the current widget.
+        If the spectrometer is active, its widgets are added to the stacked widgets and shown.
+        Otherwise this is deferred until the spectrometer is activated.
 
         Args:
             module (BaseSpectrometer) : The spectrometer module that was just added
         """
-        logger.debug(
-            "Adding settings widget to stacked widget: %s", module.settings_view
-        )
-        self._ui_form.stackedWidgetSettings.addWidget(module.settings_view)
-        self._ui_form.stackedWidgetSettings.setCurrentWidget(module.settings_view)
-
-        try:
+        if module is not self._module.model.active_spectrometer:
             logger.debug(
-                "Adding pulse programmer widget to stacked widget: %s",
-                module.model.pulse_programmer.pulse_programmer_view,
+                "Deferring the widgets of inactive spectrometer %s", module.model.name
             )
-            self._ui_form.stackedWidgetPulseProgrammer.addWidget(
-                module.model.pulse_programmer.pulse_programmer_view
-            )
-            self._ui_form.stackedWidgetPulseProgrammer.setCurrentWidget(
-                module.model.pulse_programmer.pulse_programmer_view
+            return
+
+        self._show_spectrometer_views(module)
+
+    def _show_spectrometer_views(self, module) -> None:
+        """Shows the settings and pulse programmer views of a spectrometer.
+
+        Views that are not part of the stacked widgets yet are added first.
+        The signals of a stacked widget are blocked while adding, so only the change of the current widget is emitted.
+
+        Args:
+            module (BaseSpectrometer) : The spectrometer module whose views are shown
+        """
+        settings_stack = self._ui_form.stackedWidgetSettings
+        if settings_stack.indexOf(module.settings_view) == -1:
+            logger.debug(
+                "Adding settings widget to stacked widget: %s", module.settings_view
             )
+            blocker = QSignalBlocker(settings_stack)
+            settings_stack.addWidget(module.settings_view)
+            blocker.unblock()
+        settings_stack.setCurrentWidget(module.settings_view)
+
+        pulse_programmer_stack = self._ui_form.stackedWidgetPulseProgrammer
+        try:
+            pulse_programmer_view = module.model.pulse_programmer.pulse_programmer_view
         except AttributeError:
             logger.debug(
-                "No pulse programmer widget to add for spectrometer %s",
+                "No pulse programmer widget to show for spectrometer %s",
                 module.model.name,
             )
             # Sets the pulse programmer widget to a blank widget if there is no pulse programmer widget.
-            self._ui_form.stackedWidgetPulseProgrammer.addWidget(self.blank)
-            self._ui_form.stackedWidgetPulseProgrammer.setCurrentWidget(self.blank)
+            pulse_programmer_view = self.blank
 
+        if pulse_programmer_stack.indexOf(pulse_programmer_view) == -1:
+            logger.debug(
+                "Adding pulse programmer widget to stacked widget: %s",
+                pulse_programmer_view,
+            )
+            blocker = QSignalBlocker(pulse_programmer_stack)
+            pulse_programmer_stack.addWidget(pulse_programmer_view)
+            blocker.unblock()
+        pulse_programmer_stack.setCurrentWidget(pulse_programmer_view)
+
+    @pyqtSlot(BaseSpectrometer)
     def on_spectrometer_added(self, module):
         """This method changes the active spectrometer to the one that was just added.
 
         Args:
             module (BaseSpectrometer) : The spectrometer module that was just added
         """
-        module.change_spectrometer.connect(self.on_menu_button_clicked)
+        try:
+            module.change_spectrometer.connect(
+                self.on_menu_button_clicked, Qt.ConnectionType.UniqueConnection
+            )
+        except TypeError:
+            # The spectrometer was added before, the slot is already connected
+            logger.debug("Spectrometer %s is already connected", module.model.name)
         self.on_spectrometer_widget_changed(module)
 
     def create_menu_entry(self):
@@ -120,22 +149,22 @@ class SpectrometerView(ModuleView):
         self._actions["Spectrometer"].setEnabled(False)
         menu_item.addSeparator()
 
+        # Checking the disabled, non-checkable header action is a no-op if there are no spectrometers
+        last_added_action = self._actions["Spectrometer"]
         for (
             spectrometer_name,
             spectrometer_module,
         ) in self._module.model._available_spectrometers.items():
             logger.debug("Adding module to menu: %s", spectrometer_name)
-            self._actions[spectrometer_name] = QAction(
-                spectrometer_module.model.toolbar_name, menu_item
-            )
-            self._actions[spectrometer_name].triggered.connect(
-                spectrometer_module.set_active
-            )
+            action = QAction(spectrometer_module.model.toolbar_name, menu_item)
+            action.triggered.connect(spectrometer_module.set_active)
             # Make it checkable
-            self._actions[spectrometer_name].setCheckable(True)
+            action.setCheckable(True)
+            self._action_group.addAction(action)
+            self._actions[spectrometer_name] = action
+            last_added_action = action
 
-        # Get last added action and check it
-        last_added_action = self._actions[list(self._actions.keys())[-1]]
+        # Check the last added action, it belongs to the active spectrometer
         last_added_action.setChecked(True)
 
         self.add_menubar_item.emit("Hardware", list(self._actions.values()), True)
@@ -145,14 +174,12 @@ class SpectrometerView(ModuleView):
         """This method is called when a menu button is clicked.
 
         It changes the active spectrometer to the one that was clicked.
-        It also unchecks all other menu buttons.
+        The exclusive action group unchecks all other menu buttons.
 
         Args:
             spectrometer_name (str) : The name of the spectrometer that was clicked
         """
         logger.debug("Active module changed to: %s", spectrometer_name)
-        for action in self._actions.values():
-            action.setChecked(False)
         self._actions[spectrometer_name].setChecked(True)
         self._module.model.active_spectrometer = (
             self._module.model.available_spectrometers[spectrometer_name]